@@ -19,10 +19,10 @@ vLLM Launcher
 """
 
 import asyncio
+import functools
 import logging
 import multiprocessing
 import os
-import re
 import signal
 import stat
 import sys
@@ -43,6 +43,9 @@ from vllm.utils.argparse_utils import FlexibleArgumentParser
 
 MAX_LOG_RESPONSE_BYTES = 1 * 1024 * 1024  # 1 MB default for API response
 _MAX_BROADCASTER_EVENTS = 1000
+# Log polls should not dirty the log file's inode with atime updates.
+# O_NOATIME is Linux-only; elsewhere this is a plain read-only open.
+_LOG_READ_FLAGS = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, force=True)
@@ -52,11 +55,16 @@ class LogRangeNotAvailable(Exception):
     """Raised when the requested start_byte is beyond available log content"""
 
     def __init__(self, start_byte, available_bytes):
+        # Every poll past the end of the log raises this, and the handler
+        # only reads the attributes, so the message is built on demand.
+        super().__init__(start_byte, available_bytes)
         self.start_byte = start_byte
         self.available_bytes = available_bytes
-        super().__init__(
-            f"start_byte {start_byte} is beyond available content "
-            f"({available_bytes} bytes available)"
+
+    def __str__(self):
+        return (
+            f"start_byte {self.start_byte} is beyond available content "
+            f"({self.available_bytes} bytes available)"
         )
 
 
@@ -293,11 +301,17 @@ class VllmInstance:
             self._sentinel_active = False
 
     def _cleanup_log_file(self):
-        """Remove the log file if it exists."""
+        """Remove the log file if it exists.
+
+        Failures other than a missing file are logged rather than raised,
+        so that stopping an instance is never aborted by log cleanup.
+        """
         try:
             os.unlink(self._log_file_path)
         except FileNotFoundError:
             pass
+        except OSError as e:
+            logger.warning("Failed to remove log file %s: %s", self._log_file_path, e)
 
     def get_status(self) -> dict:
         """
@@ -315,28 +329,34 @@ class VllmInstance:
         Retrieve log bytes from the child process.
         :param start: First byte to read (inclusive, 0-based).
         :param end: Last byte to read (inclusive, must be >= start).
-                    None means up to start + MAX_LOG_RESPONSE_BYTES - 1
-                    or EOF, whichever comes first.
+                    None means EOF.  Either way at most
+                    MAX_LOG_RESPONSE_BYTES are returned.
         :return: (content_bytes, current_total_log_length)
         :raises LogRangeNotAvailable: If start is beyond available content
         """
         try:
-            total = os.path.getsize(self._log_file_path)
+            fd = os.open(self._log_file_path, _LOG_READ_FLAGS)
         except FileNotFoundError:
-            total = 0
+            raise LogRangeNotAvailable(start, 0)
 
-        if start >= total:
-            raise LogRangeNotAvailable(start, total)
-
-        if end is None:
+        try:
+            # Size and data come from the same fd, so a concurrent unlink
+            # of the log file cannot make them disagree.
+            total = os.fstat(fd).st_size
+            if start >= total:
+                raise LogRangeNotAvailable(start, total)
+
+            # An explicit end is capped too, so one request cannot make the
+            # launcher read and buffer an arbitrarily large slice of the log.
             read_end = min(start + MAX_LOG_RESPONSE_BYTES - 1, total - 1)
-        else:
-            read_end = min(end, total - 1)
-
-        nbytes = read_end - start + 1
-        with open(self._log_file_path, "rb") as f:
-            f.seek(start)
-            data = f.read(nbytes)
+            if end is not None:
+                read_end = min(end, read_end)
+
+            # pread reads just the requested range at its offset, without
+            # moving a file position or going through a buffered reader.
+            data = os.pread(fd, read_end - start + 1, start)
+        finally:
+            os.close(fd)
         return (data, total)
 
 
@@ -539,9 +559,10 @@ app = FastAPI(
 )
 
 
-_RANGE_RE = re.compile(r"^bytes=(\d+)-(\d+)?$")
-
-
+# Log pollers resend the same few Range values (typically "bytes=0-" and
+# the tail they last saw), so memoize parsed results.  Malformed values
+# raise and are therefore never cached.
+@functools.lru_cache(maxsize=1024)
 def parse_range_header(range_header: str) -> tuple[int, int | None]:
     """Parse an HTTP Range header value.
 
@@ -551,17 +572,55 @@ def parse_range_header(range_header: str) -> tuple[int, int | None]:
     Raises :class:`ValueError` for unsupported or malformed values
     (e.g. suffix ranges like ``bytes=-500``).
     """
-    m = _RANGE_RE.match(range_header)
-    if m is None:
+    # The grammar is just "bytes=" DIGITS "-" [DIGITS], which plain string
+    # operations check faster than a regex.  isdecimal() accepts the same
+    # characters as the \d class used previously.
+    unit, _, spec = range_header.partition("=")
+    first, dash, last = spec.partition("-")
+    if (
+        unit != "bytes"
+        or not dash
+        or not first.isdecimal()
+        or (last and not last.isdecimal())
+    ):
         raise ValueError(f"Unsupported or malformed Range header: {range_header}")
-    start = int(m.group(1))
-    # group(2) is the end value; absent in open-ended ranges like "bytes=100-"
-    end = int(m.group(2)) if m.group(2) else None
+    start = int(first)
+    # last is empty in open-ended ranges like "bytes=100-"
+    end = int(last) if last else None
     if end is not None and end < start:
         raise ValueError(f"Range end ({end}) must be >= start ({start})")
     return (start, end)
 
 
+# Log reads currently in flight, keyed by (instance_id, start, end).
+# Concurrent polls for the same range share one read instead of each
+# opening and reading the file.
+_log_reads_in_flight: Dict[tuple, asyncio.Future] = {}
+
+
+async def _read_instance_log_bytes(
+    instance_id: str, start: int, end: int | None
+) -> tuple[bytes, int]:
+    """Read an instance's log bytes, coalescing identical concurrent reads.
+
+    The file I/O runs on a worker thread so that slow storage cannot
+    stall the event loop serving the watch stream and other requests.
+    """
+    key = (instance_id, start, end)
+    future = _log_reads_in_flight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(
+            asyncio.to_thread(
+                vllm_manager.get_instance_log_bytes, instance_id, start, end
+            )
+        )
+        _log_reads_in_flight[key] = future
+        future.add_done_callback(lambda _: _log_reads_in_flight.pop(key, None))
+    # Shield the shared read so one client disconnecting does not cancel
+    # it for the others waiting on the same result.
+    return await asyncio.shield(future)
+
+
 ############################################################
 # Health Endpoint
 ############################################################
@@ -766,7 +825,7 @@ async def get_vllm_instance_logs(
                 raise HTTPException(status_code=400, detail=str(exc))
             partial = True
 
-        data, total = vllm_manager.get_instance_log_bytes(instance_id, start, end)
+        data, total = await _read_instance_log_bytes(instance_id, start, end)
 
         actual_end = start + len(data) - 1
         headers = {
@@ -892,9 +951,9 @@ def set_env_vars(env_vars: Dict[str, str]):
     :param env_vars: Dict with environment var name as keys and string values
     """
 
-    # Set environment variables from a dictionary
-    for key, value in env_vars.items():
-        os.environ[key] = value
+    # VllmConfig validates env_vars as Dict[str, str], so the values can
+    # be handed to os.environ as-is in a single update.
+    os.environ.update(env_vars)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+# Copyright 2025 The llm-d Authors.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# 	http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared pytest setup for the launcher tests.
+
+vllm is not installed for unit tests (see requirements-sans-vllm.txt), so
+the vllm modules that launcher imports from are stubbed here.  pytest
+imports conftest.py before collecting any test module, which guarantees
+the stubs are in place before the first ``import launcher`` - something a
+fixture cannot do, since fixtures only run after collection.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+_VLLM_MODULES = (
+    "vllm",
+    "vllm.utils",
+    "vllm.utils.argparse_utils",
+    "vllm.entrypoints.openai.api_server",
+    "vllm.entrypoints.openai.cli_args",
+    "vllm.entrypoints.serve.utils.api_utils",
+)
+
+# Every stub is a child of one root mock, so ``sys.modules["vllm.utils"]``
+# and ``vllm.utils`` reached through attribute access are the same object.
+_vllm = MagicMock(name="vllm")
+
+for _name in _VLLM_MODULES:
+    _module = _vllm
+    for _attr in _name.split(".")[1:]:
+        _module = getattr(_module, _attr)
+    sys.modules[_name] = _module
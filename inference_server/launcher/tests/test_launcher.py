@@ -19,25 +19,17 @@ python -m pytest tests/test_launcher.py -v
 """
 
 import asyncio
+import json
 import os
 import signal
-import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
 from fastapi.testclient import TestClient
 from gputranslator import GpuTranslator
 
-# Mock vllm before importing launcher
-sys.modules["vllm"] = MagicMock()
-sys.modules["vllm.utils"] = MagicMock()
-sys.modules["vllm.utils.argparse_utils"] = MagicMock()
-sys.modules["vllm.entrypoints.openai.api_server"] = MagicMock()
-sys.modules["vllm.entrypoints.openai.cli_args"] = MagicMock()
-sys.modules["vllm.entrypoints.serve.utils.api_utils"] = MagicMock()
-
-# Import the application and classes
-from launcher import (  # noqa: E402
+# Import the application and classes (vllm is stubbed in conftest.py)
+from launcher import (
     MAX_LOG_RESPONSE_BYTES,
     EventBroadcaster,
     HalfMade,
@@ -47,11 +39,19 @@ from launcher import (  # noqa: E402
     VllmInstance,
     VllmMultiProcessManager,
     WatchEvent,
+    _read_instance_log_bytes,
     app,
+    health,
+    index,
     parse_range_header,
     set_env_vars,
 )
 
+# Request body shared by the instance creation tests, serialized once
+CREATE_PAYLOAD = {"options": "--model test --port 8000"}
+CREATE_BODY = json.dumps(CREATE_PAYLOAD).encode()
+JSON_HEADERS = {"content-type": "application/json"}
+
 
 # Fixtures
 @pytest.fixture
@@ -64,12 +64,29 @@ def vllm_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gpu_translator():
-    """Create a GPUTranslator for testing"""
+    """Create a GPUTranslator shared by all tests.
+
+    Construction probes NVML, so it is done once.  Tests that need to
+    control uuid_to_index use fake_gpu_translator instead.
+    """
     return GpuTranslator()
 
 
+class FakeGpuTranslator:
+    """Stand-in for GpuTranslator where only uuid_to_index is exercised"""
+
+    def __init__(self):
+        self.uuid_to_index = MagicMock(side_effect=NotImplementedError)
+
+
+@pytest.fixture
+def fake_gpu_translator():
+    """Provide a FakeGpuTranslator; cheap enough to build for every test"""
+    return FakeGpuTranslator()
+
+
 @pytest.fixture
 def vllm_config_no_env():
     """Create a VllmConfig without env vars"""
@@ -82,9 +99,9 @@ def manager(tmp_path):
     return VllmMultiProcessManager(log_dir=str(tmp_path))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a FastAPI test client"""
+    """Create a FastAPI test client shared by all tests"""
     return TestClient(app)
 
 
@@ -96,6 +113,17 @@ def tmp_log_dir(tmp_path):
 
 # Mock process for testing without actually starting vLLM
 class MockProcess:
+    __slots__ = (
+        "_is_alive",
+        "terminated",
+        "killed",
+        "pid",
+        "exitcode",
+        "_sentinel_r",
+        "_sentinel_w",
+        "sentinel",
+    )
+
     def __init__(self):
         self._is_alive = True
         self.terminated = False
@@ -140,6 +168,17 @@ class MockProcess:
                 pass
 
 
+@pytest.fixture
+def mock_process(monkeypatch):
+    """Make launcher spawn a MockProcess instead of a real vLLM process"""
+    process = MockProcess()
+    monkeypatch.setattr(
+        "launcher.multiprocessing.Process", lambda *args, **kwargs: process
+    )
+    yield process
+    process.close_sentinel()
+
+
 # Tests for VllmConfig
 class TestVllmConfig:
     def test_vllm_config_with_env_vars(self):
@@ -163,7 +202,6 @@ class TestVllmConfig:
 
 # Tests for VllmInstance
 class TestVllmInstance:
-    @patch("launcher.multiprocessing.Process")
     def test_instance_creation(self, vllm_config, gpu_translator, tmp_log_dir):
         """Test creating a VllmInstance"""
         instance = VllmInstance(
@@ -173,14 +211,10 @@ class TestVllmInstance:
         assert instance.config == vllm_config
         assert instance.process is None
 
-    @patch("launcher.multiprocessing.Process")
     def test_instance_start(
-        self, mock_process_class, vllm_config: VllmConfig, gpu_translator, tmp_log_dir
+        self, mock_process, vllm_config: VllmConfig, gpu_translator, tmp_log_dir
     ):
         """Test starting a vLLM instance"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         instance = VllmInstance(
             "test-id", vllm_config, gpu_translator, log_dir=tmp_log_dir
         )
@@ -192,14 +226,10 @@ class TestVllmInstance:
             assert result[key] == val
         assert os.path.exists(instance._log_file_path)
 
-    @patch("launcher.multiprocessing.Process")
     def test_instance_start_already_running(
-        self, mock_process_class, vllm_config: VllmConfig, gpu_translator, tmp_log_dir
+        self, mock_process, vllm_config: VllmConfig, gpu_translator, tmp_log_dir
     ):
         """Test starting an instance that's already running"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         instance = VllmInstance(
             "test-id", vllm_config, gpu_translator, log_dir=tmp_log_dir
         )
@@ -211,14 +241,10 @@ class TestVllmInstance:
         for key, val in vllm_config.model_dump(exclude_none=True).items():
             assert result[key] == val
 
-    @patch("launcher.multiprocessing.Process")
     def test_instance_stop(
-        self, mock_process_class, vllm_config: VllmConfig, gpu_translator, tmp_log_dir
+        self, mock_process, vllm_config: VllmConfig, gpu_translator, tmp_log_dir
     ):
         """Test stopping a running instance"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         instance = VllmInstance(
             "test-id", vllm_config, gpu_translator, log_dir=tmp_log_dir
         )
@@ -231,7 +257,6 @@ class TestVllmInstance:
             assert result[key] == val
         assert mock_process.terminated is True
 
-    @patch("launcher.multiprocessing.Process")
     def test_instance_stop_not_running(self, vllm_config, gpu_translator, tmp_log_dir):
         """Test stopping an instance that's not running"""
         instance = VllmInstance(
@@ -241,30 +266,33 @@ class TestVllmInstance:
             _ = instance.stop()
 
     @patch("launcher.os.killpg")
-    @patch("launcher.multiprocessing.Process")
     def test_instance_force_kill(
-        self, mock_process_class, mock_killpg, vllm_config, gpu_translator, tmp_log_dir
+        self,
+        mock_killpg,
+        mock_process,
+        monkeypatch,
+        vllm_config,
+        gpu_translator,
+        tmp_log_dir,
     ):
         """Test force killing an instance that won't terminate"""
-        mock_process = MockProcess()
 
         # Simulate process that won't die on terminate
-        def stay_alive_on_terminate():
+        def stay_alive_on_terminate(self):
             pass  # Don't change _is_alive
 
-        mock_process.terminate = stay_alive_on_terminate
+        monkeypatch.setattr(MockProcess, "terminate", stay_alive_on_terminate)
 
         # Make join after killpg finally stop the process
         call_count = 0
 
-        def join_side_effect(timeout=None):
+        def join_side_effect(self, timeout=None):
             nonlocal call_count
             call_count += 1
             if call_count > 1:
-                mock_process._is_alive = False
+                self._is_alive = False
 
-        mock_process.join = join_side_effect
-        mock_process_class.return_value = mock_process
+        monkeypatch.setattr(MockProcess, "join", join_side_effect)
 
         instance = VllmInstance(
             "test-id", vllm_config, gpu_translator, log_dir=tmp_log_dir
@@ -274,14 +302,10 @@ class TestVllmInstance:
 
         mock_killpg.assert_called_once_with(mock_process.pid, signal.SIGKILL)
 
-    @patch("launcher.multiprocessing.Process")
     def test_instance_get_status(
-        self, mock_process_class, vllm_config: VllmConfig, gpu_translator, tmp_log_dir
+        self, mock_process, vllm_config: VllmConfig, gpu_translator, tmp_log_dir
     ):
         """Test getting instance status"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         instance = VllmInstance(
             "test-id", vllm_config, gpu_translator, log_dir=tmp_log_dir
         )
@@ -300,173 +324,109 @@ class TestVllmInstance:
         for key, val in vllm_config.model_dump(exclude_none=True).items():
             assert status[key] == val
 
-    @patch("launcher.multiprocessing.Process")
-    def test_instance_uuid_to_index_translation(
-        self, mock_process_class, gpu_translator, tmp_log_dir
+    @pytest.mark.parametrize(
+        "gpu_uuids,initial_env,indices,expected_cvd",
+        [
+            pytest.param(
+                ["GPU-uuid-1234", "GPU-uuid-5678", "GPU-uuid-9abc"],
+                None,
+                [0, 2, 3],
+                "0,2,3",
+                id="translates-uuids",
+            ),
+            pytest.param(
+                ["GPU-uuid-aaa", "GPU-uuid-bbb"],
+                None,
+                [1, 3],
+                "1,3",
+                id="creates-env-vars-if-none",
+            ),
+            pytest.param(
+                ["GPU-uuid-xyz"],
+                {"CUSTOM_VAR": "custom_value", "ANOTHER_VAR": "123"},
+                [0],
+                "0",
+                id="preserves-existing-env-vars",
+            ),
+            pytest.param(
+                None,
+                {"SOME_VAR": "value"},
+                [],
+                None,
+                id="no-translation-without-uuids",
+            ),
+        ],
+    )
+    def test_instance_uuid_translation(
+        self,
+        mock_process,
+        fake_gpu_translator,
+        tmp_log_dir,
+        gpu_uuids,
+        initial_env,
+        indices,
+        expected_cvd,
     ):
-        """Test that GPU UUIDs are correctly translated to
-        indices and CUDA_VISIBLE_DEVICES is set"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
-        # Mock the uuid_to_index method to return predictable indices
-        test_uuids = ["GPU-uuid-1234", "GPU-uuid-5678", "GPU-uuid-9abc"]
-        expected_indices = [0, 2, 3]
-
-        # Create a mock that returns indices based on the UUID
-        uuid_to_index_map = dict(zip(test_uuids, expected_indices))
-        gpu_translator.uuid_to_index = MagicMock(
-            side_effect=lambda uuid: uuid_to_index_map[uuid]
-        )
+        """Test that GPU UUIDs are translated to indices in
+        CUDA_VISIBLE_DEVICES while other env vars are preserved"""
+        # Make uuid_to_index return predictable indices
+        uuid_to_index_map = dict(zip(gpu_uuids or [], indices))
+        fake_gpu_translator.uuid_to_index.side_effect = uuid_to_index_map.__getitem__
 
-        # Create config with GPU UUIDs
         config = VllmConfig(
-            options="--model test-model --port 8000", gpu_uuids=test_uuids
+            options="--model test-model --port 8000",
+            gpu_uuids=gpu_uuids,
+            env_vars=None if initial_env is None else initial_env.copy(),
         )
 
         # Create instance (this triggers UUID translation in __init__)
-        instance = VllmInstance("test-id", config, gpu_translator, log_dir=tmp_log_dir)
+        instance = VllmInstance(
+            "test-id", config, fake_gpu_translator, log_dir=tmp_log_dir
+        )
 
-        # Verify uuid_to_index was called for each UUID
-        assert gpu_translator.uuid_to_index.call_count == len(test_uuids)
-        for uuid_str in test_uuids:
-            gpu_translator.uuid_to_index.assert_any_call(uuid_str)
+        # Verify uuid_to_index was called once for each UUID, if any
+        assert fake_gpu_translator.uuid_to_index.call_count == len(gpu_uuids or [])
+        for uuid_str in gpu_uuids or []:
+            fake_gpu_translator.uuid_to_index.assert_any_call(uuid_str)
 
-        # Verify CUDA_VISIBLE_DEVICES was set correctly
-        assert "CUDA_VISIBLE_DEVICES" in instance.config.env_vars
-        assert instance.config.env_vars["CUDA_VISIBLE_DEVICES"] == "0,2,3"
+        # Verify CUDA_VISIBLE_DEVICES was set (or not) and nothing was lost
+        env_vars = instance.config.env_vars
+        assert env_vars.get("CUDA_VISIBLE_DEVICES") == expected_cvd
+        for key, val in (initial_env or {}).items():
+            assert env_vars[key] == val
 
         # Verify the instance can be started with the translated indices
         result = instance.start()
         assert result["status"] == "started"
 
-    @patch("launcher.multiprocessing.Process")
-    def test_instance_uuid_translation_creates_env_vars_if_none(
-        self, mock_process_class, gpu_translator, tmp_log_dir
-    ):
-        """Test that env_vars dict is created when
-        gpu_uuids provided but env_vars is None"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
-        # Mock uuid_to_index
-        gpu_translator.uuid_to_index = MagicMock(side_effect=[1, 3])
-
-        # Create config WITHOUT env_vars but WITH gpu_uuids
-        config = VllmConfig(
-            options="--model test-model --port 8000",
-            gpu_uuids=["GPU-uuid-aaa", "GPU-uuid-bbb"],
-        )
-
-        # Verify env_vars is None initially
-        assert config.env_vars is None
-
-        # Create instance
-        instance = VllmInstance("test-id", config, gpu_translator, log_dir=tmp_log_dir)
-
-        # Verify env_vars was created and CUDA_VISIBLE_DEVICES was set
-        assert instance.config.env_vars is not None
-        assert instance.config.env_vars["CUDA_VISIBLE_DEVICES"] == "1,3"
-
-    @patch("launcher.multiprocessing.Process")
-    def test_instance_uuid_translation_preserves_existing_env_vars(
-        self, mock_process_class, gpu_translator, tmp_log_dir
-    ):
-        """Test that existing env_vars are preserved when adding CUDA_VISIBLE_DEVICES"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
-        # Mock uuid_to_index
-        gpu_translator.uuid_to_index = MagicMock(return_value=0)
-
-        # Create config with existing env_vars
-        existing_env_vars = {"CUSTOM_VAR": "custom_value", "ANOTHER_VAR": "123"}
-        config = VllmConfig(
-            options="--model test-model --port 8000",
-            gpu_uuids=["GPU-uuid-xyz"],
-            env_vars=existing_env_vars.copy(),
-        )
-
-        # Create instance
-        instance = VllmInstance("test-id", config, gpu_translator, log_dir=tmp_log_dir)
-
-        # Verify existing env_vars are preserved
-        assert instance.config.env_vars["CUSTOM_VAR"] == "custom_value"
-        assert instance.config.env_vars["ANOTHER_VAR"] == "123"
-        # And CUDA_VISIBLE_DEVICES was added
-        assert instance.config.env_vars["CUDA_VISIBLE_DEVICES"] == "0"
-
-    @patch("launcher.multiprocessing.Process")
-    def test_instance_no_uuid_translation_when_gpu_uuids_none(
-        self, mock_process_class, gpu_translator, tmp_log_dir
-    ):
-        """Test that uuid_to_index is not called when gpu_uuids is None"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
-        # Mock uuid_to_index to track calls
-        gpu_translator.uuid_to_index = MagicMock()
-
-        # Create config WITHOUT gpu_uuids
-        config = VllmConfig(
-            options="--model test-model --port 8000", env_vars={"SOME_VAR": "value"}
-        )
-
-        # Create instance
-        instance = VllmInstance("test-id", config, gpu_translator, log_dir=tmp_log_dir)
-
-        # Verify uuid_to_index was NOT called
-        gpu_translator.uuid_to_index.assert_not_called()
-
-        # Verify CUDA_VISIBLE_DEVICES was NOT added
-        assert "CUDA_VISIBLE_DEVICES" not in instance.config.env_vars
-
 
 # Tests for VllmMultiProcessManager
 class TestVllmMultiProcessManager:
-    @patch("launcher.multiprocessing.Process")
-    def test_create_instance_auto_id(self, mock_process_class, manager, vllm_config):
+    def test_create_instance_auto_id(self, mock_process, manager, vllm_config):
         """Test creating instance with auto-generated ID"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         result = manager.create_instance(vllm_config)
 
         assert result["status"] == "running"
         assert "instance_id" in result
         assert len(manager.instances) == 1
 
-    @patch("launcher.multiprocessing.Process")
-    def test_create_instance_custom_id(self, mock_process_class, manager, vllm_config):
+    def test_create_instance_custom_id(self, mock_process, manager, vllm_config):
         """Test creating instance with custom ID"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         result = manager.create_instance(vllm_config, "custom-id")
 
         assert result["status"] == "running"
         assert result["instance_id"] == "custom-id"
         assert "custom-id" in manager.instances
 
-    @patch("launcher.multiprocessing.Process")
-    def test_create_instance_duplicate_id(
-        self, mock_process_class, manager, vllm_config
-    ):
+    def test_create_instance_duplicate_id(self, mock_process, manager, vllm_config):
         """Test creating instance with duplicate ID raises error"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         manager.create_instance(vllm_config, "duplicate-id")
 
         with pytest.raises(ValueError, match="already exists"):
             manager.create_instance(vllm_config, "duplicate-id")
 
-    @patch("launcher.multiprocessing.Process")
-    def test_stop_instance(self, mock_process_class, manager, vllm_config):
+    def test_stop_instance(self, mock_process, manager, vllm_config):
         """Test stopping a specific instance"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         result = manager.create_instance(vllm_config, "test-id")
         instance_id = result["instance_id"]
 
@@ -475,18 +435,13 @@ class TestVllmMultiProcessManager:
         assert stop_result["status"] == "stopped"
         assert instance_id not in manager.instances  # Should be cleaned up
 
-    @patch("launcher.multiprocessing.Process")
-    def test_stop_nonexistent_instance(self, mock_process_class, manager):
+    def test_stop_nonexistent_instance(self, manager):
         """Test stopping instance that doesn't exist"""
         with pytest.raises(KeyError, match="not found"):
             manager.stop_instance("nonexistent-id")
 
-    @patch("launcher.multiprocessing.Process")
-    def test_stop_all_instances(self, mock_process_class, manager, vllm_config):
+    def test_stop_all_instances(self, mock_process, manager, vllm_config):
         """Test stopping all instances"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         # Create multiple instances
         manager.create_instance(vllm_config, "id-1")
         manager.create_instance(vllm_config, "id-2")
@@ -498,14 +453,8 @@ class TestVllmMultiProcessManager:
         assert result["total_stopped"] == 3
         assert len(manager.instances) == 0
 
-    @patch("launcher.multiprocessing.Process")
-    def test_get_instance_status(
-        self, mock_process_class, manager, vllm_config: VllmConfig
-    ):
+    def test_get_instance_status(self, mock_process, manager, vllm_config: VllmConfig):
         """Test getting status of specific instance"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         manager.create_instance(vllm_config, "test-id")
         status = manager.get_instance_status("test-id")
 
@@ -514,18 +463,13 @@ class TestVllmMultiProcessManager:
         for key, val in vllm_config.model_dump(exclude_none=True).items():
             assert status[key] == val
 
-    @patch("launcher.multiprocessing.Process")
-    def test_get_instance_status_nonexistent(self, mock_process_class, manager):
+    def test_get_instance_status_nonexistent(self, manager):
         """Test getting status of nonexistent instance"""
         with pytest.raises(KeyError, match="not found"):
             manager.get_instance_status("nonexistent-id")
 
-    @patch("launcher.multiprocessing.Process")
-    def test_get_all_instances_status(self, mock_process_class, manager, vllm_config):
+    def test_get_all_instances_status(self, mock_process, manager, vllm_config):
         """Test getting status of all instances"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         manager.create_instance(vllm_config, "id-1")
         manager.create_instance(vllm_config, "id-2")
 
@@ -538,12 +482,8 @@ class TestVllmMultiProcessManager:
             for key, val in vllm_config.model_dump(exclude_none=True).items():
                 assert inst[key] == val
 
-    @patch("launcher.multiprocessing.Process")
-    def test_list_instances(self, mock_process_class, manager, vllm_config):
+    def test_list_instances(self, mock_process, manager, vllm_config):
         """Test listing all instance IDs"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         manager.create_instance(vllm_config, "id-1")
         manager.create_instance(vllm_config, "id-2")
 
@@ -553,12 +493,8 @@ class TestVllmMultiProcessManager:
         assert "id-1" in instances
         assert "id-2" in instances
 
-    @patch("launcher.multiprocessing.Process")
-    def test_get_instance_log_bytes(self, mock_process_class, manager, vllm_config):
+    def test_get_instance_log_bytes(self, mock_process, manager, vllm_config):
         """Test getting log bytes from a specific instance"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         manager.create_instance(vllm_config, "test-id")
 
         # Write log data directly to the instance's log file
@@ -574,20 +510,13 @@ class TestVllmMultiProcessManager:
         assert b"Log line 3" in data
         assert total == 30
 
-    @patch("launcher.multiprocessing.Process")
-    def test_get_instance_log_bytes_nonexistent(self, mock_process_class, manager):
+    def test_get_instance_log_bytes_nonexistent(self, manager):
         """Test getting log bytes from nonexistent instance raises KeyError"""
         with pytest.raises(KeyError, match="not found"):
             manager.get_instance_log_bytes("nonexistent-id")
 
-    @patch("launcher.multiprocessing.Process")
-    def test_get_instance_log_bytes_with_end(
-        self, mock_process_class, manager, vllm_config
-    ):
+    def test_get_instance_log_bytes_with_end(self, mock_process, manager, vllm_config):
         """Test that get_instance_log_bytes respects end parameter"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         manager.create_instance(vllm_config, "test-id")
 
         # Write log data directly to the instance's log file
@@ -604,17 +533,23 @@ class TestVllmMultiProcessManager:
 
 # Tests for API Endpoints
 class TestAPIEndpoints:
-    def test_health_endpoint(self, client):
+    def test_trivial_routes_registered(self):
+        """Test that the trivial GET handlers are served at their paths"""
+        assert app.url_path_for("health") == "/health"
+        assert app.url_path_for("index") == "/"
+
+    def test_health_endpoint(self):
         """Test health check endpoint"""
-        response = client.get("/health")
+        # No middleware or request parsing involved, so skip the HTTP round trip
+        response = asyncio.run(health())
         assert response.status_code == 200
-        assert response.json() == {"status": "OK"}
+        assert json.loads(response.body) == {"status": "OK"}
 
-    def test_index_endpoint(self, client):
+    def test_index_endpoint(self):
         """Test index endpoint"""
-        response = client.get("/")
+        response = asyncio.run(index())
         assert response.status_code == 200
-        data = response.json()
+        data = json.loads(response.body)
         assert data["name"] == "Multi-Instance vLLM Management API"
         assert data["version"] == "2.0"
         assert "endpoints" in data
@@ -629,7 +564,7 @@ class TestAPIEndpoints:
         }
 
         response = client.post(
-            "/v2/vllm/instances", json={"options": "--model test --port 8000"}
+            "/v2/vllm/instances", content=CREATE_BODY, headers=JSON_HEADERS
         )
 
         assert response.status_code == 201
@@ -646,25 +581,13 @@ class TestAPIEndpoints:
         }
 
         response = client.put(
-            "/v2/vllm/instances/custom-id", json={"options": "--model test --port 8000"}
+            "/v2/vllm/instances/custom-id", content=CREATE_BODY, headers=JSON_HEADERS
         )
 
         assert response.status_code == 201
         data = response.json()
         assert data["instance_id"] == "custom-id"
 
-    @patch("launcher.vllm_manager")
-    def test_create_duplicate_instance(self, mock_manager, client):
-        """Test creating instance with duplicate ID returns 409"""
-        mock_manager.create_instance.side_effect = ValueError("already exists")
-
-        response = client.put(
-            "/v2/vllm/instances/duplicate-id",
-            json={"options": "--model test --port 8000"},
-        )
-
-        assert response.status_code == 409
-
     @patch("launcher.vllm_manager")
     def test_delete_vllm_instance(self, mock_manager, client):
         """Test deleting vLLM instance via API"""
@@ -679,15 +602,6 @@ class TestAPIEndpoints:
         data = response.json()
         assert data["status"] == "terminated"
 
-    @patch("launcher.vllm_manager")
-    def test_delete_nonexistent_instance(self, mock_manager, client):
-        """Test deleting nonexistent instance returns 404"""
-        mock_manager.stop_instance.side_effect = KeyError("not found")
-
-        response = client.delete("/v2/vllm/instances/nonexistent-id")
-
-        assert response.status_code == 404
-
     @patch("launcher.vllm_manager")
     def test_delete_all_instances(self, mock_manager, client):
         """Test deleting all instances via API"""
@@ -702,20 +616,26 @@ class TestAPIEndpoints:
         data = response.json()
         assert data["status"] == "all_stopped"
 
+    @pytest.mark.parametrize(
+        "detail,expected",
+        [
+            pytest.param(
+                False,
+                {"count": 2, "instance_ids": ["id-1", "id-2"], "revision": 5},
+                id="ids-only",
+            ),
+            pytest.param(
+                True,
+                {"total_instances": 1, "running_instances": 1, "revision": 3},
+                id="detailed",
+            ),
+        ],
+    )
     @patch("launcher.vllm_manager")
-    def test_list_instances(self, mock_manager, client):
+    def test_list_instances(self, mock_manager, client, detail, expected):
         """Test listing instances via API"""
         mock_manager.list_instances.return_value = ["id-1", "id-2"]
         mock_manager.revision = 5
-
-        response = client.get("/v2/vllm/instances?detail=False")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["count"] == 2
-        assert "id-1" in data["instance_ids"]
-        assert data["revision"] == 5
-
         mock_manager.get_all_instances_status.return_value = {
             "revision": 3,
             "total_instances": 1,
@@ -726,13 +646,12 @@ class TestAPIEndpoints:
             },
         }
 
-        response = client.get("/v2/vllm/instances?detail=True")
+        response = client.get(f"/v2/vllm/instances?detail={detail}")
 
         assert response.status_code == 200
         data = response.json()
-        assert data["total_instances"] == 1
-        assert data["running_instances"] == 1
-        assert data["revision"] == 3
+        for key, value in expected.items():
+            assert data[key] == value
 
     @patch("launcher.vllm_manager")
     def test_get_instance_status(self, mock_manager, client):
@@ -753,15 +672,6 @@ class TestAPIEndpoints:
         assert data["options"] == "--model test-model"
         assert data["env_vars"] == {"KEY": "val"}
 
-    @patch("launcher.vllm_manager")
-    def test_get_nonexistent_instance_status(self, mock_manager, client):
-        """Test getting status of nonexistent instance returns 404"""
-        mock_manager.get_instance_status.side_effect = KeyError("not found")
-
-        response = client.get("/v2/vllm/instances/nonexistent-id")
-
-        assert response.status_code == 404
-
     @patch("launcher.vllm_manager")
     def test_get_instance_logs_endpoint(self, mock_manager, client):
         """Test getting instance logs without Range header returns 200"""
@@ -791,29 +701,88 @@ class TestAPIEndpoints:
         assert response.status_code == 206
         mock_manager.get_instance_log_bytes.assert_called_once_with("test-id", 0, 4999)
 
+    @pytest.mark.parametrize(
+        "method,url,headers,manager_method,side_effect,"
+        "expected_status,expected_headers",
+        [
+            pytest.param(
+                "PUT",
+                "/v2/vllm/instances/duplicate-id",
+                JSON_HEADERS,
+                "create_instance",
+                ValueError("already exists"),
+                409,
+                {},
+                id="create-duplicate-409",
+            ),
+            pytest.param(
+                "DELETE",
+                "/v2/vllm/instances/nonexistent-id",
+                None,
+                "stop_instance",
+                KeyError("not found"),
+                404,
+                {},
+                id="delete-nonexistent-404",
+            ),
+            pytest.param(
+                "GET",
+                "/v2/vllm/instances/nonexistent-id",
+                None,
+                "get_instance_status",
+                KeyError("not found"),
+                404,
+                {},
+                id="status-nonexistent-404",
+            ),
+            pytest.param(
+                "GET",
+                "/v2/vllm/instances/nonexistent-id/log",
+                None,
+                "get_instance_log_bytes",
+                KeyError("not found"),
+                404,
+                {},
+                id="logs-nonexistent-404",
+            ),
+            pytest.param(
+                "GET",
+                "/v2/vllm/instances/test-id/log",
+                {"Range": "bytes=5000-"},
+                "get_instance_log_bytes",
+                LogRangeNotAvailable(5000, 1000),
+                416,
+                {"content-range": "bytes */1000"},
+                id="logs-range-not-available-416",
+            ),
+        ],
+    )
     @patch("launcher.vllm_manager")
-    def test_get_instance_logs_nonexistent_endpoint(self, mock_manager, client):
-        """Test getting logs from nonexistent instance returns 404"""
-        mock_manager.get_instance_log_bytes.side_effect = KeyError("not found")
-
-        response = client.get("/v2/vllm/instances/nonexistent-id/log")
-
-        assert response.status_code == 404
-
-    @patch("launcher.vllm_manager")
-    def test_get_instance_logs_range_not_available(self, mock_manager, client):
-        """Test getting logs with start beyond available content returns 416"""
-        mock_manager.get_instance_log_bytes.side_effect = LogRangeNotAvailable(
-            5000, 1000
-        )
-
-        response = client.get(
-            "/v2/vllm/instances/test-id/log",
-            headers={"Range": "bytes=5000-"},
+    def test_manager_error_status_codes(
+        self,
+        mock_manager,
+        client,
+        method,
+        url,
+        headers,
+        manager_method,
+        side_effect,
+        expected_status,
+        expected_headers,
+    ):
+        """Test that manager errors map to the right HTTP status codes"""
+        getattr(mock_manager, manager_method).side_effect = side_effect
+
+        response = client.request(
+            method,
+            url,
+            headers=headers,
+            content=CREATE_BODY if method == "PUT" else None,
         )
 
-        assert response.status_code == 416
-        assert response.headers["content-range"] == "bytes */1000"
+        assert response.status_code == expected_status
+        for name, value in expected_headers.items():
+            assert response.headers[name] == value
 
     @patch("launcher.vllm_manager")
     def test_get_instance_logs_partial_content_206(self, mock_manager, client):
@@ -1012,6 +981,16 @@ class TestLogFile:
         assert b"Message" in data
         assert total == 12
 
+    def test_explicit_end_capped_at_max_response(self, gpu_translator, tmp_log_dir):
+        """Test that an explicit end cannot exceed MAX_LOG_RESPONSE_BYTES"""
+        instance = self._make_instance(gpu_translator, tmp_log_dir)
+        with open(instance._log_file_path, "wb") as f:
+            f.truncate(MAX_LOG_RESPONSE_BYTES + 10)
+
+        data, total = instance.get_log_bytes(start=5, end=MAX_LOG_RESPONSE_BYTES + 8)
+        assert len(data) == MAX_LOG_RESPONSE_BYTES
+        assert total == MAX_LOG_RESPONSE_BYTES + 10
+
     def test_unicode_bytes(self, gpu_translator, tmp_log_dir):
         """Test that raw bytes with unicode are returned as-is"""
         instance = self._make_instance(gpu_translator, tmp_log_dir)
@@ -1183,14 +1162,15 @@ class TestEventBroadcaster:
 class TestSentinelWatcher:
     """Test suite for VllmInstance sentinel-based process exit detection."""
 
-    def test_sentinel_invokes_callback_on_exit(self, gpu_translator, tmp_log_dir):
+    def test_sentinel_invokes_callback_on_exit(
+        self, mock_process, gpu_translator, tmp_log_dir
+    ):
         """When a process exits, the sentinel watcher invokes the callback."""
 
         async def run():
             config = VllmConfig(options="--model test --port 8000")
             instance = VllmInstance("test-id", config, gpu_translator, tmp_log_dir)
-            mock_proc = MockProcess()
-            instance.process = mock_proc
+            instance.process = mock_process
 
             callback_calls = []
 
@@ -1201,7 +1181,7 @@ class TestSentinelWatcher:
             assert instance._sentinel_active is True
 
             # Simulate process exit
-            mock_proc.simulate_exit(exitcode=-9)
+            mock_process.simulate_exit(exitcode=-9)
 
             # Give the event loop a chance to fire the reader callback
             await asyncio.sleep(0.05)
@@ -1210,18 +1190,17 @@ class TestSentinelWatcher:
             assert callback_calls[0] == ("test-id", -9)
             assert instance._sentinel_active is False
 
-            mock_proc.close_sentinel()
-
         asyncio.run(run())
 
-    def test_sentinel_cancelled_on_explicit_stop(self, gpu_translator, tmp_log_dir):
+    def test_sentinel_cancelled_on_explicit_stop(
+        self, mock_process, gpu_translator, tmp_log_dir
+    ):
         """When stop is called explicitly, sentinel is cancelled (no callback)."""
 
         async def run():
             config = VllmConfig(options="--model test --port 8000")
             instance = VllmInstance("test-id", config, gpu_translator, tmp_log_dir)
-            mock_proc = MockProcess()
-            instance.process = mock_proc
+            instance.process = mock_process
             # Create log file so stop() cleanup doesn't fail
             open(instance._log_file_path, "wb").close()
 
@@ -1236,8 +1215,6 @@ class TestSentinelWatcher:
             # No callback should have fired
             assert len(callback_calls) == 0
 
-            mock_proc.close_sentinel()
-
         asyncio.run(run())
 
 
@@ -1247,8 +1224,8 @@ class TestWatchAPIEndpoint:
 
     def test_watch_endpoint_content_type(self, client):
         """The watch endpoint returns application/x-ndjson."""
-        mock_manager = MagicMock()
-        mock_broadcaster = MagicMock()
+        mock_manager = create_autospec(VllmMultiProcessManager, instance=True)
+        mock_broadcaster = create_autospec(EventBroadcaster, instance=True)
         mock_manager.revision = 0
 
         async def mock_watch(since_revision=0):
@@ -1268,10 +1245,8 @@ class TestWatchAPIEndpoint:
 
     def test_watch_with_since_streams_events(self, client):
         """With ?since=N, the stream yields events from that revision."""
-        import json
-
-        mock_manager = MagicMock()
-        mock_broadcaster = MagicMock()
+        mock_manager = create_autospec(VllmMultiProcessManager, instance=True)
+        mock_broadcaster = create_autospec(EventBroadcaster, instance=True)
         mock_broadcaster.oldest_revision = 0
 
         events = [
@@ -1304,10 +1279,8 @@ class TestWatchAPIEndpoint:
 
     def test_watch_without_since_sends_initial_state(self, client):
         """Without ?since, existing instances are sent as CREATED first."""
-        import json
-
-        mock_manager = MagicMock()
-        mock_broadcaster = MagicMock()
+        mock_manager = create_autospec(VllmMultiProcessManager, instance=True)
+        mock_broadcaster = create_autospec(EventBroadcaster, instance=True)
         mock_manager.revision = 5
 
         # No new events from broadcaster
@@ -1318,7 +1291,7 @@ class TestWatchAPIEndpoint:
         mock_broadcaster.watch = mock_watch
 
         # One existing instance
-        mock_instance = MagicMock()
+        mock_instance = create_autospec(VllmInstance, instance=True)
         mock_instance.get_status.return_value = {
             "status": "running",
             "instance_id": "existing-1",
@@ -1379,6 +1352,9 @@ class TestLogStartOffset:
 
         assert exc_info.value.start_byte == 50
         assert exc_info.value.available_bytes == 20
+        assert str(exc_info.value) == (
+            "start_byte 50 is beyond available content (20 bytes available)"
+        )
 
     def test_start_equal_to_length_raises_error(self, gpu_translator, tmp_log_dir):
         """Test that start equal to file size raises LogRangeNotAvailable"""
@@ -1411,14 +1387,10 @@ class TestLogFileCleanup:
         config = VllmConfig(options="--model test --port 8000")
         return VllmInstance("test-id", config, gpu_translator, log_dir=log_dir)
 
-    @patch("launcher.multiprocessing.Process")
     def test_stop_terminated_cleans_up_log_file(
-        self, mock_process_class, gpu_translator, tmp_log_dir
+        self, mock_process, gpu_translator, tmp_log_dir
     ):
         """Test that stop() removes the log file after terminating"""
-        mock_process = MockProcess()
-        mock_process_class.return_value = mock_process
-
         instance = self._make_instance(gpu_translator, tmp_log_dir)
         instance.start()
         assert os.path.exists(instance._log_file_path)
@@ -1432,6 +1404,16 @@ class TestLogFileCleanup:
         # Should not raise
         instance._cleanup_log_file()
 
+    @patch("launcher.os.unlink", side_effect=PermissionError("denied"))
+    def test_cleanup_error_is_not_raised(
+        self, mock_unlink, gpu_translator, tmp_log_dir
+    ):
+        """Test that _cleanup_log_file logs, not raises, other OS errors"""
+        instance = self._make_instance(gpu_translator, tmp_log_dir)
+        # Should not raise
+        instance._cleanup_log_file()
+        mock_unlink.assert_called_once_with(instance._log_file_path)
+
 
 class TestParseRangeHeader:
     """Tests for the parse_range_header helper function"""
@@ -1448,26 +1430,98 @@ class TestParseRangeHeader:
         """Test parsing large byte values"""
         assert parse_range_header("bytes=1048576-2097151") == (1048576, 2097151)
 
-    def test_suffix_range_rejected(self):
-        """Test that suffix range bytes=-500 raises ValueError"""
-        with pytest.raises(ValueError, match="Unsupported or malformed"):
-            parse_range_header("bytes=-500")
-
-    def test_invalid_unit(self):
-        """Test that non-bytes unit raises ValueError"""
-        with pytest.raises(ValueError, match="Unsupported or malformed"):
-            parse_range_header("items=0-99")
-
-    def test_garbage_input(self):
-        """Test that garbage input raises ValueError"""
+    @pytest.mark.parametrize(
+        "header",
+        [
+            pytest.param("bytes=-500", id="suffix-range"),
+            pytest.param("items=0-99", id="invalid-unit"),
+            pytest.param("not-a-range", id="garbage"),
+            pytest.param("bytes=0-1,5-6", id="multiple-ranges"),
+            pytest.param("bytes=0-1-2", id="extra-separator"),
+            pytest.param("bytes=0", id="missing-separator"),
+        ],
+    )
+    def test_malformed_header_rejected(self, header):
+        """Test that unsupported or malformed values raise ValueError"""
         with pytest.raises(ValueError, match="Unsupported or malformed"):
-            parse_range_header("not-a-range")
+            parse_range_header(header)
 
     def test_end_less_than_start(self):
         """Test that end < start raises ValueError"""
         with pytest.raises(ValueError, match="must be >= start"):
             parse_range_header("bytes=100-50")
 
+    def test_repeated_header_is_cached(self):
+        """Test that re-parsing the same header value hits the cache"""
+        parse_range_header.cache_clear()
+        assert parse_range_header("bytes=0-") == (0, None)
+        assert parse_range_header("bytes=0-") == (0, None)
+        info = parse_range_header.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+
+class TestLogReadCoalescing:
+    """Tests for coalescing of concurrent identical log reads"""
+
+    @patch("launcher.vllm_manager")
+    def test_identical_concurrent_reads_share_one_read(self, mock_manager):
+        """Test that concurrent reads of the same range hit the file once"""
+        mock_manager.get_instance_log_bytes.return_value = (b"tail", 4)
+
+        async def run():
+            return await asyncio.gather(
+                _read_instance_log_bytes("test-id", 0, None),
+                _read_instance_log_bytes("test-id", 0, None),
+            )
+
+        results = asyncio.run(run())
+
+        assert results == [(b"tail", 4), (b"tail", 4)]
+        mock_manager.get_instance_log_bytes.assert_called_once_with("test-id", 0, None)
+
+    @patch("launcher.vllm_manager")
+    def test_different_ranges_are_read_separately(self, mock_manager):
+        """Test that reads of different ranges are not coalesced"""
+        mock_manager.get_instance_log_bytes.return_value = (b"tail", 4)
+
+        async def run():
+            await asyncio.gather(
+                _read_instance_log_bytes("test-id", 0, None),
+                _read_instance_log_bytes("test-id", 2, None),
+            )
+
+        asyncio.run(run())
+
+        assert mock_manager.get_instance_log_bytes.call_count == 2
+
+    @patch("launcher.vllm_manager")
+    def test_sequential_reads_are_not_cached(self, mock_manager):
+        """Test that a finished read is not reused by a later poll"""
+        mock_manager.get_instance_log_bytes.return_value = (b"tail", 4)
+
+        asyncio.run(_read_instance_log_bytes("test-id", 0, None))
+        asyncio.run(_read_instance_log_bytes("test-id", 0, None))
+
+        assert mock_manager.get_instance_log_bytes.call_count == 2
+
+    @patch("launcher.vllm_manager")
+    def test_errors_reach_every_waiter(self, mock_manager):
+        """Test that a failed shared read raises in every caller"""
+        mock_manager.get_instance_log_bytes.side_effect = LogRangeNotAvailable(10, 4)
+
+        async def run():
+            return await asyncio.gather(
+                _read_instance_log_bytes("test-id", 10, None),
+                _read_instance_log_bytes("test-id", 10, None),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, LogRangeNotAvailable) for r in results)
+        mock_manager.get_instance_log_bytes.assert_called_once()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])